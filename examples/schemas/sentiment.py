@@ -4,7 +4,12 @@ Schemas for sentiment analysis output.
 
 from enum import Enum
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 class SentimentType(str, Enum):
@@ -29,9 +34,8 @@ class SentimentAnalysisOutput(BaseModel):
     aspects: List[SentimentAspect] = Field(default_factory=list, description="Analysis of specific aspects of the text")
     summary: str = Field(..., description="A brief summary of the sentiment analysis")
     
-    class Config:
-        """Configuration for the model"""
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "overall_sentiment": "positive",
                 "confidence": 0.85,
@@ -49,4 +53,24 @@ class SentimentAnalysisOutput(BaseModel):
                 ],
                 "summary": "The text is generally positive, especially about customer service, with some minor concerns about product durability."
             }
-        } 
\ No newline at end of file
+        }
+    )
+
+
+if msgspec is not None:
+    # typing.Annotated is 3.9+; typing_extensions is always installed alongside pydantic
+    from typing_extensions import Annotated
+
+    class SentimentAspectStruct(msgspec.Struct):
+        """msgspec variant of SentimentAspect for fast output decoding"""
+        aspect: str
+        sentiment: SentimentType
+        explanation: str
+
+
+    class SentimentAnalysisOutputStruct(msgspec.Struct):
+        """msgspec variant of SentimentAnalysisOutput for fast output decoding"""
+        overall_sentiment: SentimentType
+        confidence: Annotated[float, msgspec.Meta(ge=0.0, le=1.0)]
+        summary: str
+        aspects: List[SentimentAspectStruct] = []
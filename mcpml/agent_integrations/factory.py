@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import functools
 import importlib
+import importlib.metadata
+import importlib.util
 import inspect  
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from mcpml.config.mcpml import MCPServerDefinition
 from mcpml.agent_integrations.base import MCPAgent
-from mcpml.agent_integrations.openai import MCPOpenAIAgent
 
 logger = logging.getLogger(__name__)
 
+# Entry point group under which packages register custom agent types
+AGENT_ENTRY_POINT_GROUP = "mcpml.agents"
+
+# Custom agent classes already resolved, keyed by agent type
+_agent_class_cache: Dict[str, Type[MCPAgent]] = {}
+
 
 def create_agent(
     agent_type: str = "simple",
@@ -38,12 +46,23 @@ def create_agent(
     Returns:
         An instance of MCPAgent
     """
+    from mcpml.agent_integrations.openai import MCPOpenAIAgent
+
     mcp_servers = mcp_servers or []
     
-    # First, try to load a custom agent type from the current working directory
-    # custom_agent = _load_custom_agent_type(agent_type, instructions, model, output_type, **kwargs)
-    # if custom_agent:
-    #     return custom_agent
+    # First, try to load a custom agent type (built-in types skip the entry point scan)
+    if agent_type and agent_type != "simple":
+        custom_agent = _load_custom_agent_type(
+            agent_type,
+            instructions,
+            model,
+            output_type,
+            tools=tools,
+            mcp_servers=mcp_servers,
+            **kwargs
+        )
+        if custom_agent:
+            return custom_agent
     
     # If no custom agent was found, use the built-in types
     if agent_type == "simple":
@@ -68,6 +87,44 @@ def create_agent(
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _agent_entry_points() -> Dict[str, importlib.metadata.EntryPoint]:
+    """
+    Get the custom agent types registered by installed packages
+    
+    Returns:
+        A dictionary of agent type name to entry point
+    """
+    entry_points = importlib.metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        group = entry_points.select(group=AGENT_ENTRY_POINT_GROUP)
+    else:
+        # Python < 3.10 returns a dict of group name to entry points
+        group = entry_points.get(AGENT_ENTRY_POINT_GROUP, [])
+    return {ep.name: ep for ep in group}
+
+
+@functools.lru_cache(maxsize=1)
+def _agent_search_paths() -> Tuple[str, ...]:
+    """
+    Get the existing directories that may contain custom agent types
+    
+    Returns:
+        A tuple of directory paths, resolved once per process
+    """
+    # Possible locations for custom agent types
+    cwd = os.getcwd()
+    search_paths = [
+        # Current working directory
+        cwd,
+        # 'agents' directory in current working directory
+        os.path.join(cwd, "agents"),
+        # 'agent_types' directory in current working directory
+        os.path.join(cwd, "agent_types"),
+    ]
+    return tuple(p for p in search_paths if os.path.isdir(p))
+
+
 def _load_custom_agent_type(
     agent_type: str,
     instructions: str,
@@ -76,7 +133,11 @@ def _load_custom_agent_type(
     **kwargs
 ) -> Optional[MCPAgent]:
     """
-    Attempt to load a custom agent type from the current working directory
+    Attempt to load a custom agent type
+
+    Agent types registered under the ``mcpml.agents`` entry point group are
+    looked up first. Probing the current working directory for agent modules
+    is only done when ``MCPML_LOCAL_AGENTS=1`` is set.
     
     Args:
         agent_type: The type of agent to load
@@ -88,21 +149,40 @@ def _load_custom_agent_type(
     Returns:
         An instance of MCPAgent if found, None otherwise
     """
-    # Possible locations for custom agent types
-    search_paths = [
-        # Current working directory
-        os.getcwd(),
-        # 'agents' directory in current working directory
-        os.path.join(os.getcwd(), "agents"),
-        # 'agent_types' directory in current working directory
-        os.path.join(os.getcwd(), "agent_types"),
-    ]
+    # Reuse a previously resolved agent class
+    agent_class = _agent_class_cache.get(agent_type)
+    if agent_class is not None:
+        return agent_class(
+            model=model,
+            instructions=instructions,
+            output_type=output_type,
+            **kwargs
+        )
+
+    # Look up agent types registered by installed packages
+    entry_point = _agent_entry_points().get(agent_type)
+    if entry_point is not None:
+        agent_class = entry_point.load()
+        logger.info(f"Found custom agent type '{agent_type}' in entry point '{entry_point.value}'")
+        _agent_class_cache[agent_type] = agent_class
+        return agent_class(
+            model=model,
+            instructions=instructions,
+            output_type=output_type,
+            **kwargs
+        )
+
+    # Filesystem discovery is opt-in
+    if os.environ.get("MCPML_LOCAL_AGENTS") != "1":
+        return None
+
+    search_paths = _agent_search_paths()
+    if not search_paths:
+        return None
     
     # Add search paths to sys.path temporarily
-    original_sys_path = sys.path.copy()
-    for path in search_paths:
-        if path not in sys.path and os.path.exists(path):
-            sys.path.insert(0, path)
+    added_paths = [p for p in search_paths if p not in sys.path]
+    sys.path[0:0] = added_paths
     
     try:
         # Try different module naming patterns
@@ -116,17 +196,23 @@ def _load_custom_agent_type(
         
         for module_name in possible_modules:
             try:
-                # Try to import the module
+                # Probe for the module before paying for a full import
+                if importlib.util.find_spec(module_name) is None:
+                    continue
                 module = importlib.import_module(module_name)
                 
-                # Look for a class that inherits from MCPAgent
-                for name, obj in inspect.getmembers(module):
+                # Look for a class defined in this module that inherits from MCPAgent
+                # (vars() avoids the getattr on every attribute done by getmembers;
+                # imported base classes such as MCPOpenAIAgent are skipped)
+                for name, obj in list(vars(module).items()):
                     if (
                         inspect.isclass(obj) 
                         and issubclass(obj, MCPAgent) 
                         and obj != MCPAgent
+                        and obj.__module__ == module.__name__
                     ):
                         logger.info(f"Found custom agent type '{agent_type}' in module '{module_name}'")
+                        _agent_class_cache[agent_type] = obj
                         
                         # Create an instance of the agent
                         return obj(
@@ -136,11 +222,15 @@ def _load_custom_agent_type(
                             **kwargs
                         )
             
-            except (ImportError, ModuleNotFoundError):
+            except (ImportError, ModuleNotFoundError, ValueError):
                 continue
         
         return None
     
     finally:
-        # Restore original sys.path
-        sys.path = original_sys_path
+        # Remove only the paths added above
+        for path in added_paths:
+            try:
+                sys.path.remove(path)
+            except ValueError:
+                pass
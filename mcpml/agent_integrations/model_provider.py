@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import os
+
+from agents import Model, ModelProvider, OpenAIChatCompletionsModel
+from openai import AsyncOpenAI, AsyncAzureOpenAI
+
+
+class CustomModelProvider(ModelProvider):
+    def __init__(self):
+        # Build the client once so every model served by this provider
+        # shares one connection pool
+        if(os.environ.get("AZURE_OPENAI_API_KEY")):
+            self._client = AsyncAzureOpenAI(
+                api_key=os.environ.get("AZURE_OPENAI_API_KEY"),
+                azure_endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT"),     
+                api_version=os.environ.get("OPENAI_API_VERSION"),
+            )
+        else:
+            self._client = AsyncOpenAI(
+                api_key=os.environ.get("OPENAI_API_KEY"),
+            )
+
+    def get_model(self, model_name: str | None) -> Model:
+        return OpenAIChatCompletionsModel(model=model_name, openai_client=self._client)
@@ -1,38 +1,38 @@
 from __future__ import annotations
 
+import functools
 import importlib
-import json
 import logging
-import os
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
 import asyncio
 
-import requests
-import yaml
-
-from agents import Agent, Runner, Tool, Model, ModelSettings, ModelResponse, TResponseInputItem, AgentOutputSchema, Handoff, ModelTracing, ModelProvider, RunConfig, function_tool
-from agents.mcp import MCPServerSse, MCPServerStdio
-from agents import OpenAIChatCompletionsModel
 from mcpml.mcp_server.tools import execute_tool
 from mcpml.agent_integrations.base import MCPAgent
-from mcpml.config.mcpml import config,ToolDefinition,MCPServerDefinition
-from openai import AsyncOpenAI, AsyncAzureOpenAI
+from mcpml.config.mcpml import get_config,ToolDefinition,MCPServerDefinition
+
+if TYPE_CHECKING:
+    from agents import Tool
+
 logger = logging.getLogger(__name__)
 
 
-class CustomModelProvider(ModelProvider):
-    def get_model(self, model_name: str | None) -> Model:
-        if(os.environ.get("AZURE_OPENAI_API_KEY")):
-            client = AsyncAzureOpenAI(
-                api_key=os.environ.get("AZURE_OPENAI_API_KEY"),
-                azure_endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT"),     
-                api_version=os.environ.get("OPENAI_API_VERSION"),
-            )
-        else:
-            client = AsyncOpenAI(
-                api_key=os.environ.get("OPENAI_API_KEY"),
-            )
-        return OpenAIChatCompletionsModel(model=model_name, openai_client=client)
+@functools.lru_cache(maxsize=256)
+def _load_impl(impl_path: str) -> Tool:
+    """
+    Resolve a tool implementation path and wrap it as a function tool
+    
+    Args:
+        impl_path: Dotted path to the implementation (e.g. "custom_tools.math.calculate")
+        
+    Returns:
+        The wrapped function tool, cached per implementation path
+    """
+    from agents import function_tool
+
+    module, function = impl_path.rsplit(".", 1)
+    implementation = importlib.import_module(module)
+    return function_tool(getattr(implementation, function))
+
 
 class MCPOpenAIAgent(MCPAgent):
     """
@@ -68,8 +68,9 @@ class MCPOpenAIAgent(MCPAgent):
         self.mcp_servers = {}
         self.tools = []
         if(tools):
+            config = get_config()
             for tool_name in tools:
-                tool = next((t for t in config.tools if t.name == tool_name), None)
+                tool = config.tools_by_name.get(tool_name)
                 if(tool):
                     self.add_tool(tool)
                 else:
@@ -77,10 +78,14 @@ class MCPOpenAIAgent(MCPAgent):
         # Add additional MCP servers if provided directly
         if mcp_servers:
             for server in mcp_servers:
+                # skip servers listed more than once
+                if server.name in self.mcp_servers:
+                    continue
                 if(server.url):
                     self._add_mcp_server(server.name, server.url)
                 elif(server.command):
                     self._add_mcp_stdio_server(server.name, server.command, server.args,server.env)        
+        self._server_list = [server_info["server"] for server_info in self.mcp_servers.values()]
 
     def _add_mcp_server(self, name: str, url: str) -> None:
         """
@@ -90,6 +95,8 @@ class MCPOpenAIAgent(MCPAgent):
             name: Name of the server
             url: URL of the server
         """
+        from agents.mcp import MCPServerSse
+
         self.mcp_servers[name] = {
             "type": "sse",
             "url": url,
@@ -108,6 +115,8 @@ class MCPOpenAIAgent(MCPAgent):
             command: Command to run
             args: Arguments for the command
         """
+        from agents.mcp import MCPServerStdio
+
         self.mcp_servers[name] = {
             "type": "stdio",
             "command": command,
@@ -133,14 +142,12 @@ class MCPOpenAIAgent(MCPAgent):
         # make tool
         tool_function = None
         if(tool.implementation):
-            # load the implementation
-            # split the implementation into module and function 
-            module, function = tool.implementation.rsplit(".", 1)
-            implementation = importlib.import_module(module)            
-            tool_function = getattr(implementation, function)
-            tool_function = function_tool(tool_function)
+            # load the implementation (cached per implementation path)
+            tool_function = _load_impl(tool.implementation)
         else:
             # create a function that will invoke the agent
+            from agents import function_tool
+
             @function_tool
             def invoke_agent(input:str):
                 return execute_tool(tool.name,input)
@@ -158,13 +165,15 @@ class MCPOpenAIAgent(MCPAgent):
         Returns:
             The result of processing the query
         """
+        from agents import Agent, Runner, RunConfig
+        from mcpml.agent_integrations.model_provider import CustomModelProvider
+
         try:
             # Get all MCP servers
-            mcp_servers = [server_info["server"] for server_info in self.mcp_servers.values()]
-            for name,server in self.mcp_servers.items():
-                # connect the server
-                print("connecting to server",name)
-                await server["server"].connect()
+            mcp_servers = self._server_list
+            # connect the servers concurrently
+            logger.debug("connecting to servers %s", list(self.mcp_servers))
+            await asyncio.gather(*(server.connect() for server in mcp_servers))
 
             # Create an agent with the MCP tools and servers
 
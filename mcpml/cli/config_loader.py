@@ -1,49 +1,63 @@
+import functools
 import hashlib
 import importlib
 import logging
 import os
+import pickle
+import re
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Tuple, Optional
-from dotenv import load_dotenv
 import typer
-import yaml
 
-
-from mcpml.config.mcpml import MCPMLConfig
+from mcpml.config.mcpml import MCPMLConfig, read_mcpml_yaml
 
 
 logger = logging.getLogger(__name__)
 
+# Source prefixes treated as GitHub repositories
+GITHUB_URL_PREFIXES = ("https://github.com/", "git@github.com:", "ssh://git@github.com/", "http://github.com/")
+
+# Stamp files kept inside cached repositories
+LAST_PULL_STAMP_FILE = ".mcpml_last_pull"
+REQUIREMENTS_STAMP_FILE = ".mcpml_requirements.sha256"
+
+# Seconds a cached repository is used without fetching, unless MCPML_REPO_TTL overrides it
+DEFAULT_REPO_TTL = 3600.0
+
+@functools.lru_cache(maxsize=1)
 def get_cache_dir() -> Path:
-    """Gets the cache directory for cloned repositories."""
+    """Gets the cache directory for cloned repositories (created once per process)."""
     cache_base = Path.home() / ".cache" / "mcpml" / "repos"
     cache_base.mkdir(parents=True, exist_ok=True)
     return cache_base
 
 def is_github_url(source: str) -> bool:
     """Checks if the source string is a GitHub URL."""
-    return source.startswith("https://github.com/") or source.startswith("git@github.com:")
+    return source.startswith(GITHUB_URL_PREFIXES)
 
 def run_git_command(command: list[str], cwd: Optional[Path] = None) -> bool:
     """Runs a git command using subprocess."""
     try:
+        # Only keep stdout around when it will actually be logged
         process = subprocess.run(
             ["git"] + command,
-            capture_output=True,
-            text=True,
-            check=True,
+            stdout=subprocess.PIPE if logger.isEnabledFor(logging.DEBUG) else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             cwd=cwd,
         )
-        logger.debug(f"Git command '{' '.join(command)}' successful. Output:\n{process.stdout}")
+        if process.returncode != 0:
+            logger.error(f"Error running git command '{' '.join(command)}':\n{process.stderr.decode(errors='replace')}")
+            return False
+        if process.stdout is not None:
+            logger.debug(f"Git command '{' '.join(command)}' successful. Output:\n{process.stdout.decode(errors='replace')}")
         return True
     except FileNotFoundError:
         logger.error("Error: 'git' command not found. Please ensure Git is installed and in your PATH.")
         return False
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error running git command '{' '.join(command)}':\n{e.stderr}")
-        return False
     except Exception as e:
         logger.error(f"An unexpected error occurred while running git command '{' '.join(command)}': {e}")
         return False
@@ -51,21 +65,22 @@ def run_git_command(command: list[str], cwd: Optional[Path] = None) -> bool:
 def run_command(command: list[str], cwd: Optional[Path] = None) -> bool:
     """Runs a general command using subprocess."""
     try:
+        # Only keep stdout around when it will actually be logged
         process = subprocess.run(
             command,
-            capture_output=True,
-            text=True,
-            check=True,
+            stdout=subprocess.PIPE if logger.isEnabledFor(logging.DEBUG) else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             cwd=cwd,
         )
-        logger.debug(f"Command '{' '.join(command)}' successful. Output:\n{process.stdout}")
+        if process.returncode != 0:
+            logger.error(f"Error running command '{' '.join(command)}':\n{process.stderr.decode(errors='replace')}")
+            return False
+        if process.stdout is not None:
+            logger.debug(f"Command '{' '.join(command)}' successful. Output:\n{process.stdout.decode(errors='replace')}")
         return True
     except FileNotFoundError:
         logger.error(f"Error: '{command[0]}' command not found.")
         return False
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error running command '{' '.join(command)}':\n{e.stderr}")
-        return False
     except Exception as e:
         logger.error(f"An unexpected error occurred while running command '{' '.join(command)}': {e}")
         return False
@@ -96,13 +111,52 @@ def run_installation_scripts(repo_path: Path) -> None:
     # Check for and install requirements.txt
     requirements_file = repo_path / "requirements.txt"
     if requirements_file.exists():
-        logger.info(f"Found requirements.txt. Installing dependencies...")
-        success = run_command([sys.executable, "-m", "pip", "install", "-r", str(requirements_file)], cwd=repo_path)
+        # Skip the install if requirements.txt hasn't changed since the last one into this interpreter
+        requirements_hash = hashlib.sha256(
+            sys.executable.encode() + b"\0" + requirements_file.read_bytes()
+        ).hexdigest()
+        requirements_stamp = repo_path / REQUIREMENTS_STAMP_FILE
+        if requirements_stamp.is_file() and requirements_stamp.read_text().strip() == requirements_hash:
+            logger.info("requirements.txt unchanged since last install. Skipping...")
+            return
+        uv = shutil.which("uv")
+        if uv:
+            logger.info("Found requirements.txt. Installing dependencies with uv...")
+            # Target the running interpreter; `uv pip sync` would uninstall mcpml's own dependencies
+            install_command = [uv, "pip", "install", "--python", sys.executable, "-r", str(requirements_file)]
+        else:
+            logger.info("Found requirements.txt. Installing dependencies with pip...")
+            install_command = [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)]
+        success = run_command(install_command, cwd=repo_path)
         if not success:
             logger.warning("Failed to install requirements")
         else:
+            requirements_stamp.write_text(requirements_hash)
             logger.info("Requirements installed successfully")
 
+def get_repo_ttl() -> float:
+    """Gets the repository update TTL in seconds from MCPML_REPO_TTL, falling back to the default."""
+    ttl = os.environ.get("MCPML_REPO_TTL")
+    if ttl is None:
+        return DEFAULT_REPO_TTL
+    try:
+        return float(ttl)
+    except ValueError:
+        logger.warning(f"Invalid MCPML_REPO_TTL value '{ttl}', using {DEFAULT_REPO_TTL:g} seconds")
+        return DEFAULT_REPO_TTL
+
+def is_repo_fresh(repo_path: Path) -> bool:
+    """Checks if the cached repository was updated within MCPML_REPO_TTL seconds."""
+    try:
+        last_pull = float((repo_path / LAST_PULL_STAMP_FILE).read_text())
+    except (OSError, ValueError):
+        return False
+    return (time.time() - last_pull) < get_repo_ttl()
+
+def stamp_repo_pull(repo_path: Path) -> None:
+    """Records the time of the last successful repository update."""
+    (repo_path / LAST_PULL_STAMP_FILE).write_text(str(time.time()))
+
 def resolve_remote_config(source: str) -> Path:
     """
     Resolves a configuration source. If it's a GitHub URL, clones or updates
@@ -111,8 +165,8 @@ def resolve_remote_config(source: str) -> Path:
     """
     if is_github_url(source):
         repo_url = source
-        # Create a unique directory name based on the URL hash
-        url_hash = hashlib.sha256(repo_url.encode()).hexdigest()[:16]
+        # Create a unique directory name based on the URL hash (16 hex chars)
+        url_hash = hashlib.blake2b(repo_url.encode(), digest_size=8).hexdigest()
         # Try to extract a readable name, e.g., 'user-repo'
         try:
             repo_name = Path(repo_url.split(':')[-1].replace('.git', '')).name
@@ -123,19 +177,27 @@ def resolve_remote_config(source: str) -> Path:
 
         logger.info(f"Resolving remote config: {repo_url} -> {local_repo_path}")
 
-        if local_repo_path.exists():
+        if local_repo_path.exists() and is_repo_fresh(local_repo_path):
+            logger.info(f"Repository at {local_repo_path} was updated recently. Skipping update.")
+        elif local_repo_path.exists():
             logger.info(f"Repository exists at {local_repo_path}. Attempting to update...")
-            if not run_git_command(["pull"], cwd=local_repo_path):
+            # Fetch only the latest commit to keep the clone shallow
+            if not (
+                run_git_command(["fetch", "--depth=1"], cwd=local_repo_path)
+                and run_git_command(["reset", "--hard", "FETCH_HEAD"], cwd=local_repo_path)
+            ):
                 logger.warning(f"Failed to update repository {local_repo_path}. Using cached version.")
             else:
-                # Run installation scripts after successful update
-                run_installation_scripts(local_repo_path)
+                stamp_repo_pull(local_repo_path)
         else:
             logger.info(f"Cloning repository {repo_url} to {local_repo_path}...")
-            if not run_git_command(["clone", repo_url, str(local_repo_path)]):
+            if not run_git_command(["clone", "--depth=1", "--filter=blob:none", "--single-branch", repo_url, str(local_repo_path)]):
                 raise RuntimeError(f"Failed to clone repository: {repo_url}")
-            # Run installation scripts after successful clone
-            run_installation_scripts(local_repo_path)
+            stamp_repo_pull(local_repo_path)
+
+        # The TTL only gates git updates: installs run every time so a failed install, or a
+        # different interpreter, is retried (requirements are skipped by their per-interpreter stamp)
+        run_installation_scripts(local_repo_path)
 
         return local_repo_path
     else:
@@ -151,6 +213,59 @@ def resolve_remote_config(source: str) -> Path:
             raise FileNotFoundError(f"Local configuration source not found: {source}")
 
 
+@functools.lru_cache(maxsize=1)
+def _config_schema_fingerprint() -> str:
+    """Fingerprints the MCPMLConfig validation schema, so pickles from another mcpml or pydantic version are not reused."""
+    import pydantic
+
+    # model refs carry a per-process id suffix (e.g. 'ToolDefinition:9486...'); drop it to keep the key stable
+    schema = re.sub(r":\d+'", "'", repr(MCPMLConfig.__pydantic_core_schema__))
+    return hashlib.sha256(f"{pydantic.VERSION}:{schema}".encode()).hexdigest()[:16]
+
+def _parsed_config_cache_path(config_file_path: Path) -> Path:
+    """
+    Gets the parsed-config cache file for a config file. The file name is keyed by the
+    config path, and its suffix by mtime, size and the config schema.
+    """
+    stat = config_file_path.stat()
+    path_key = hashlib.sha256(str(config_file_path.resolve()).encode()).hexdigest()[:16]
+    state_key = hashlib.sha256(
+        f"{stat.st_mtime_ns}:{stat.st_size}:{_config_schema_fingerprint()}".encode()
+    ).hexdigest()[:16]
+    return get_cache_dir().parent / "parsed" / f"{path_key}-{state_key}.pkl"
+
+def _load_cached_config(config_file_path: Path) -> Optional[MCPMLConfig]:
+    """Loads a previously parsed config for an unchanged config file, if any."""
+    cache_path = _parsed_config_cache_path(config_file_path)
+    if not cache_path.is_file():
+        return None
+    try:
+        # Unpickling restores the validated model without re-running validation
+        with open(cache_path, 'rb') as f:
+            config = pickle.load(f)
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable parsed config cache {cache_path}: {e}")
+        return None
+    if not isinstance(config, MCPMLConfig):
+        return None
+    logger.debug(f"Loaded parsed configuration from cache {cache_path}")
+    return config
+
+def _store_cached_config(config_file_path: Path, config: MCPMLConfig) -> None:
+    """Stores a parsed config so unchanged config files skip YAML parsing and validation."""
+    try:
+        cache_path = _parsed_config_cache_path(config_file_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Keep only the latest entry per config file; older ones can never match again
+        path_key = cache_path.name.split("-", 1)[0]
+        for stale_path in cache_path.parent.glob(f"{path_key}-*.pkl"):
+            stale_path.unlink(missing_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        logger.debug(f"Could not write parsed config cache for {config_file_path}: {e}")
+
+
 def load_config_from_source(source: str) -> Tuple[MCPMLConfig, Path]:
     """
     Loads MCPML configuration from a given source (local path or GitHub URL).
@@ -184,31 +299,31 @@ def load_config_from_source(source: str) -> Tuple[MCPMLConfig, Path]:
 
         # Load the config (assuming MCPMLConfig has a suitable class method)
         # You might need to adjust this based on how MCPMLConfig loads YAML
-        with open(config_file_path, 'r') as f:
-             config_dict = yaml.safe_load(f)
-             if not config_dict:
-                 raise ValueError(f"Configuration file is empty or invalid: {config_file_path}")
-             # Assume MCPMLConfig can be instantiated from a dict or has a from_dict method
-             # This part depends heavily on the actual MCPMLConfig implementation
-             if hasattr(MCPMLConfig, 'from_dict'):
-                 config = MCPMLConfig.from_dict(config_dict)
-             elif hasattr(MCPMLConfig, 'parse_obj'): # Pydantic v1 style
-                 config = MCPMLConfig.parse_obj(config_dict)
-             elif hasattr(MCPMLConfig, 'model_validate'): # Pydantic v2 style
-                 config = MCPMLConfig.model_validate(config_dict)
-             else:
-                 # Basic instantiation if no specific method exists
-                  try:
-                     config = MCPMLConfig(**config_dict)
-                  except TypeError:
-                     logger.error("Cannot instantiate MCPMLConfig. Please ensure it has a suitable constructor or factory method (e.g., from_dict, parse_obj, model_validate).")
-                     raise RuntimeError("Failed to load configuration due to MCPMLConfig instantiation error.")
+        config = _load_cached_config(config_file_path)
+        if config is None:
+            config_dict = read_mcpml_yaml(config_file_path)
+            if not config_dict:
+                raise ValueError(f"Configuration file is empty or invalid: {config_file_path}")
+            # Assume MCPMLConfig can be instantiated from a dict or has a from_dict method
+            # This part depends heavily on the actual MCPMLConfig implementation
+            if hasattr(MCPMLConfig, 'from_dict'):
+                config = MCPMLConfig.from_dict(config_dict)
+            elif hasattr(MCPMLConfig, 'parse_obj'): # Pydantic v1 style
+                config = MCPMLConfig.parse_obj(config_dict)
+            elif hasattr(MCPMLConfig, 'model_validate'): # Pydantic v2 style
+                config = MCPMLConfig.model_validate(config_dict)
+            else:
+                # Basic instantiation if no specific method exists
+                try:
+                    config = MCPMLConfig(**config_dict)
+                except TypeError:
+                    logger.error("Cannot instantiate MCPMLConfig. Please ensure it has a suitable constructor or factory method (e.g., from_dict, parse_obj, model_validate).")
+                    raise RuntimeError("Failed to load configuration due to MCPMLConfig instantiation error.")
+            _store_cached_config(config_file_path, config)
         
         if(config is None):
             raise typer.Exit(1)
 
-        # Load the environment variables
-        load_dotenv('./.env')
         logger.info(f"Successfully loaded configuration from {config_file_path}")
         return config, config_dir
 
@@ -1,27 +1,59 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import json
 import logging
+import math
 import os
 import shutil
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import typer
+from typer.core import TyperGroup
 from typer.models import CommandInfo
 from click import Context, Command
-import yaml
-from rich.console import Console
-from rich.table import Table
 
-from mcpml.mcp_server.server import create_server
-from mcpml.mcp_server.tools import execute_tool
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from mcpml.cli.config_loader import load_config_from_source
 
 app = typer.Typer(help="MCPML - Model Context Protocol Markup Language")
-console = Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Get the shared rich console, created on first use"""
+    from rich.console import Console
+
+    return Console()
+
+
+def _has_non_finite_float(obj) -> bool:
+    """Check for NaN/Infinity, which orjson writes as null where json writes NaN/Infinity"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in obj)
+    return False
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to indented JSON, using orjson when it is installed"""
+    if orjson is not None and not _has_non_finite_float(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the json module handles
+            pass
+    return json.dumps(obj, indent=2)
 
 # Configure logging
 logging.basicConfig(
@@ -53,15 +85,33 @@ ConfigOption = typer.Option(
 )
 
 # Import the standard config - will be used as a fallback
-from mcpml.config.mcpml import config as default_config
-load_dotenv('./.env')
-load_dotenv()
+from mcpml.config.mcpml import get_config
+from mcpml.utils import ensure_cwd_on_path
+
+# Environment files already loaded in this process
+_loaded_env_files: set = set()
+
+
+def _ensure_dotenv(env_file=".env") -> None:
+    """Load an environment file once per process (skipped when MCPML_SKIP_DOTENV=1)"""
+    if os.environ.get("MCPML_SKIP_DOTENV") == "1":
+        return
+    env_file_key = os.path.abspath(env_file)
+    if env_file_key in _loaded_env_files:
+        return
+    load_dotenv(env_file)
+    _loaded_env_files.add(env_file_key)
+
+
 def get_config_and_setup_env(config_source: Optional[str] = None):
     """
     Gets the configuration and sets up the environment.
     If config_source is provided, it will be used instead of the default config.
     Returns a tuple of (config, config_dir)
     """
+    # The working directory .env takes precedence over config env files
+    _ensure_dotenv()
+    ensure_cwd_on_path()
     if config_source:
         # Load from the provided source (local or GitHub)
         try:
@@ -78,34 +128,52 @@ def get_config_and_setup_env(config_source: Optional[str] = None):
                 env_file_path = config_dir / config.settings.env_file
                 if env_file_path.exists():
                     logger.info(f"Loading environment variables from {env_file_path}")
-                    load_dotenv(env_file_path)
+                    _ensure_dotenv(env_file_path)
                 else:
                     logger.warning(f"Environment file not found: {env_file_path}")
             
             return config, config_dir
         except Exception as e:
             logger.error(f"Error loading configuration from {config_source}: {e}")
-            console.print(f"[bold red]Error:[/] Failed to load configuration from {config_source}: {e}")
+            _console().print(f"[bold red]Error:[/] Failed to load configuration from {config_source}: {e}")
             raise typer.Exit(1)
     else:
         # Use the default configuration
+        default_config = get_config()
         if default_config is None:
-            console.print(f"[bold red]Error:[/] Default configuration not found")
+            _console().print(f"[bold red]Error:[/] Default configuration not found")
             raise typer.Exit(1)
         
-        # The default config is already loaded in the module, just need to set up env
+        # The default config is loaded on first use, just need to set up env
         if default_config.settings.env_file:
-            load_dotenv(default_config.settings.env_file)
-        else:
-            load_dotenv()
+            _ensure_dotenv(default_config.settings.env_file)
         
-        # Add current directory to path (same as before)
-        if os.getcwd() not in sys.path:
-            sys.path.append(os.getcwd())
-            
         return default_config, Path(os.getcwd())
 
 
+def _tool_to_dict(tool) -> Dict[str, Any]:
+    """Convert a tool definition to a JSON/YAML-serializable dict"""
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "parameters": [
+            {
+                "name": p.name,
+                "type": p.type,
+                "description": p.description,
+                "required": p.required,
+                "default": p.default,
+            }
+            for p in tool.parameters
+        ],
+    }
+
+
+def _tools_payload(tools) -> Dict[str, Any]:
+    """Build the serializable tool listing shared by the json and yaml formats"""
+    return {"tools": [_tool_to_dict(tool) for tool in tools]}
+
+
 def list_tools(
     format: str = typer.Option(
         "table", help="Output format (table, json, yaml)"
@@ -118,48 +186,17 @@ def list_tools(
     tools = config.tools
     
     if format == "json":
-        # Convert to JSON-serializable format
-        result = {"tools": []}
-        for tool in tools:
-            tool_data = {
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": [
-                    {
-                        "name": p.name,
-                        "type": p.type,
-                        "description": p.description,
-                        "required": p.required,
-                        "default": p.default,
-                    }
-                    for p in tool.parameters
-                ],
-            }
-            result["tools"].append(tool_data)
-        console.print(json.dumps(result, indent=2))
+        _console().print(_json_dumps(_tools_payload(tools)))
     
     elif format == "yaml":
-        # Convert to YAML-serializable format
-        result = {"tools": []}
-        for tool in tools:
-            tool_data = {
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": [
-                    {
-                        "name": p.name,
-                        "type": p.type,
-                        "description": p.description,
-                        "required": p.required,
-                        "default": p.default,
-                    }
-                    for p in tool.parameters
-                ],
-            }
-            result["tools"].append(tool_data)
-        console.print(yaml.dump(result, default_flow_style=False))
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        _console().print(yaml.dump(_tools_payload(tools), Dumper=dumper, default_flow_style=False))
     
     else:  # table
+        from rich.table import Table
+
         table = Table(title="Available Tools")
         table.add_column("Name")
         table.add_column("Description")
@@ -177,11 +214,37 @@ def list_tools(
                 ", ".join(params),
             )
         
-        console.print(table)
+        _console().print(table)
+
 
 
+class LazyToolsGroup(TyperGroup):
+    """
+    `tools` command group that also exposes a sub-command per tool in the
+    default config (backward compatibility), resolved only when requested
+    """
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        commands = super().list_commands(ctx)
+        default_config = get_config()
+        if default_config is not None:
+            commands += [t.name for t in default_config.tools if t.name not in commands]
+        return commands
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Optional[Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None:
+            command = _build_tool_command(cmd_name)
+        return command
 
-tools_app = typer.Typer(help="Manage MCP tools")
+
+tools_app = typer.Typer(help="Manage MCP tools", cls=LazyToolsGroup)
+
+@tools_app.callback()
+def tools_callback():
+    """Manage MCP tools"""
+    # per-tool subcommands call their implementation directly, so load the env here
+    _ensure_dotenv()
 
 @tools_app.command("list")
 def list_tools_command(
@@ -195,9 +258,6 @@ def list_tools_command(
 
 
 
-# append the current dir (cwd) to the sys.path
-sys.path.append(os.getcwd())
-
 @tools_app.command("run")
 def run_tool(
     tool_name: str = typer.Argument(..., help="Name of the tool to execute"),
@@ -205,20 +265,23 @@ def run_tool(
     config_source: Optional[str] = ConfigOption,
 ):
     """Run a specific tool with JSON input"""
+    from mcpml.mcp_server.tools import execute_tool
+
     config, config_dir = get_config_and_setup_env(config_source)
     
     # Find the tool definition
-    tool = next((t for t in config.tools if t.name == tool_name), None)
+    tool = config.tools_by_name.get(tool_name)
     if not tool:
-        console.print(f"[bold red]Error:[/] Tool '{tool_name}' not found in configuration")
+        _console().print(f"[bold red]Error:[/] Tool '{tool_name}' not found in configuration")
         raise typer.Exit(1)
     
     # Load the input parameters
     if input_json:
         try:
+            # json keeps big integers exact and accepts NaN/Infinity; orjson does neither
             parameters = json.loads(input_json)
         except json.JSONDecodeError:
-            console.print(f"[bold red]Error:[/] Invalid JSON input: {input_json}")
+            _console().print(f"[bold red]Error:[/] Invalid JSON input: {input_json}")
             raise typer.Exit(1)
     else:
         parameters = {}
@@ -237,53 +300,50 @@ def run_tool(
         
         # Print the result
         if isinstance(result, dict) or isinstance(result, list):
-            console.print(json.dumps(result, indent=2))
+            _console().print(_json_dumps(result))
         else:
-            console.print(str(result))
+            _console().print(str(result))
     
     except Exception as e:
-        console.print(f"[bold red]Error executing tool '{tool_name}':[/] {str(e)}")
+        _console().print(f"[bold red]Error executing tool '{tool_name}':[/] {str(e)}")
         raise typer.Exit(1)
 
 # register the commands
 app.add_typer(tools_app, name="tools")
 
-# The following code is only run if default_config is available (backward compatibility)
-if default_config is not None:
-    # Dynamically add individual tool commands for backward compatibility
-    for tool in default_config.tools:
-        tool_args = tool.parameters
-        tool_args_dict = {p.name: p for p in tool_args}
-        cmd = typer.Typer(help=tool.description, name=tool.name)
-        
-        if tool.implementation:
-            # Function
-            module_name, function_name = tool.implementation.rsplit('.', 1)
-            try:
-                # Use try/except to avoid breaking if the module can't be imported yet
-                module = importlib.import_module(module_name)
-                function = getattr(module, function_name)
-                
-                cmd.registered_commands.append(
-                    CommandInfo(
-                        name="run",
-                        callback=function,
-                        help=tool.description,
-                    )
-                )
-            except (ImportError, AttributeError) as e:
-                # logger.warning(f"Could not register tool {tool.name}: {e}")
-                # Skip this tool but don't crash
-                continue
-        else:
-            # Agent
-            def create_function(_tool):
-                def f(input:str):        
-                    res = execute_tool(_tool.name, input=input)
-                    print("res", _tool.name, res)
-                    return res
-                return f
-            function = create_function(tool)
+def _agent_dispatch(ctx: typer.Context, input: str):
+    """Run the agent tool whose `tools <tool_name> run` command was invoked"""
+    from mcpml.mcp_server.tools import execute_tool
+
+    # Typer type-checks callbacks, so a functools.partial binding the tool name is
+    # rejected; the parent command is named after the tool instead
+    tool_name = ctx.parent.info_name
+    result = execute_tool(tool_name, input=input)
+    _console().print(str(result))
+    return result
+
+@functools.lru_cache(maxsize=None)
+def _build_tool_command(tool_name: str) -> Optional[Command]:
+    """
+    Build the `tools <tool_name>` sub-command from the default config on first use,
+    so a tool's implementation is only imported when its command is invoked
+    """
+    default_config = get_config()
+    if default_config is None:
+        return None
+    tool = default_config.tools_by_name.get(tool_name)
+    if tool is None:
+        return None
+    cmd = typer.Typer(help=tool.description, name=tool.name)
+    
+    if tool.implementation:
+        # Function
+        module_name, function_name = tool.implementation.rsplit('.', 1)
+        ensure_cwd_on_path()
+        try:
+            # Use try/except to avoid breaking if the module can't be imported yet
+            module = importlib.import_module(module_name)
+            function = getattr(module, function_name)
             
             cmd.registered_commands.append(
                 CommandInfo(
@@ -292,8 +352,21 @@ if default_config is not None:
                     help=tool.description,
                 )
             )
-        
-        tools_app.add_typer(cmd, name=tool.name)
+        except (ImportError, AttributeError) as e:
+            # logger.warning(f"Could not register tool {tool.name}: {e}")
+            # Skip this tool but don't crash
+            return None
+    else:
+        # Agent: every agent tool shares the module-level dispatcher
+        cmd.registered_commands.append(
+            CommandInfo(
+                name="run",
+                callback=_agent_dispatch,
+                help=tool.description,
+            )
+        )
+    
+    return typer.main.get_group(cmd)
 
 @app.command("run")
 def run_server(
@@ -301,9 +374,11 @@ def run_server(
     config_source: Optional[str] = ConfigOption,
 ):
     """Run the MCP server"""
+    from mcpml.mcp_server.server import create_server
+
     config, config_dir = get_config_and_setup_env(config_source)
     
-    # console.print(f"[green]Starting MCP server[/] with config: {config}")
+    # _console().print(f"[green]Starting MCP server[/] with config: {config}")
     server = create_server(config)
     server.run(transport)
 
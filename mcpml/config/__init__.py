@@ -2,5 +2,12 @@
 Configuration handling for MCP Server
 """
 
-from mcpml.config.mcpml import MCPRequest, MCPResponse, MCPError, MCPToolDescription, MCPMLConfig, ToolDefinition, ToolParameter, MCPServerDefinition, load_mcpml_config, config
-__all__ = ["MCPRequest", "MCPResponse", "MCPError", "MCPToolDescription", "MCPMLConfig", "ToolDefinition", "ToolParameter", "MCPServerDefinition", "load_mcpml_config", "config"]
+from mcpml.config.mcpml import MCPRequest, MCPResponse, MCPError, MCPToolDescription, MCPMLConfig, ToolDefinition, ToolParameter, MCPServerDefinition, load_mcpml_config, get_config
+__all__ = ["MCPRequest", "MCPResponse", "MCPError", "MCPToolDescription", "MCPMLConfig", "ToolDefinition", "ToolParameter", "MCPServerDefinition", "load_mcpml_config", "get_config", "config"]
+
+
+def __getattr__(name: str):
+    # `config` is loaded lazily, see mcpml.config.mcpml.get_config
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,27 +1,72 @@
-from __future__ import annotations
-
+import dataclasses
+import functools
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 
 from pydantic import BaseModel, Field
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import ryaml
+except ImportError:
+    ryaml = None
 
-class MCPRequest(BaseModel):
+
+# Per-call message envelopes are plain dataclasses: they are built on every
+# request, so they skip pydantic validation (msgspec can decode into them directly)
+@dataclasses.dataclass
+class MCPRequest:
     tool: str
-    parameters: Dict[str, Any] = Field(default_factory=dict)
+    parameters: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
 
-class MCPResponse(BaseModel):
+@dataclasses.dataclass
+class MCPResponse:
     result: Any
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
 
-class MCPError(BaseModel):
+@dataclasses.dataclass
+class MCPError:
     error: str
     details: Optional[Dict[str, Any]] = None
 
 
+class ToolParameter(BaseModel):
+    """Tool parameter definition."""
+    name: str
+    type: str
+    description: str
+    required: bool = True
+    default: Optional[Any] = None
+
+
+class ToolDefinition(BaseModel):
+    """Tool definition."""
+    name: str
+    description: str
+    implementation: Optional[str] = None
+    type: str = "function"  # function or agent
+    agent_type: Optional[str] = None
+    model: Optional[str] = None
+    instructions: Optional[str] = None
+    parameters: List[ToolParameter] = []
+    output_schema: Optional[str] = None
+    mcp_servers: Optional[List[str]] = None
+    tools: Optional[List[str]] = None
+    max_turns: Optional[int] = None
+
+    @functools.cached_property
+    def parameters_by_name(self) -> Dict[str, ToolParameter]:
+        """Parameter definitions indexed by name"""
+        return {p.name: p for p in self.parameters}
+
+
 class MCPToolDescription(BaseModel):
     name: str
     description: str
@@ -55,45 +100,47 @@ class MCPMLConfig(BaseModel):
     tools: List[ToolDefinition]
     settings: Settings
 
+    @functools.cached_property
+    def tools_by_name(self) -> Dict[str, ToolDefinition]:
+        """Tool definitions indexed by name"""
+        return {t.name: t for t in self.tools}
 
 
-class ToolParameter(BaseModel):
-    """Tool parameter definition."""
-    name: str
-    type: str
-    description: str
-    required: bool = True
-    default: Optional[Any] = None
+def read_mcpml_yaml(config_path: Union[str, os.PathLike]) -> Dict[str, Any]:
+    """Parse an mcpml.yaml file, using the Rust-backed ryaml parser when it is installed"""
+    # every config path goes through here, so a file parses the same however it was named
+    if ryaml is not None:
+        with open(config_path, encoding="utf-8") as f:
+            return ryaml.loads(f.read())
+    # binary mode lets libyaml detect the encoding and skips a Python-side decode
+    with open(config_path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
 
 
-class ToolDefinition(BaseModel):
-    """Tool definition."""
-    name: str
-    description: str
-    implementation: Optional[str] = None
-    type: str = "function"  # function or agent
-    agent_type: Optional[str] = None
-    model: Optional[str] = None
-    instructions: Optional[str] = None
-    parameters: List[ToolParameter] = []
-    output_schema: Optional[str] = None
-    mcp_servers: Optional[List[str]] = None
-    tools: Optional[List[str]] = None
-    max_turns: Optional[int] = None
+@functools.lru_cache(maxsize=8)
+def _load_mcpml_config_cached(config_path: str, mtime_ns: int) -> MCPMLConfig:
+    # mtime_ns is part of the cache key so an edited file is parsed again
+    return MCPMLConfig.model_validate(read_mcpml_yaml(config_path))
 
 
 def load_mcpml_config(config_path: str) -> Optional[MCPMLConfig]:
     if not os.path.exists(config_path):
         return None
-    with open(config_path, "r") as f:
-        yamlString = f.read()
-        config = yaml.load(yamlString, Loader=yaml.FullLoader)
-    return MCPMLConfig(**config)
-        
-# load config from file
-config = load_mcpml_config("mcpml.yaml")
-if not config:
-    print("mcpml.yaml file not found")
+    config_path = os.path.abspath(config_path)
+    return _load_mcpml_config_cached(config_path, os.stat(config_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Optional[MCPMLConfig]:
+    """Load the default mcpml.yaml config on first use"""
+    return load_mcpml_config("mcpml.yaml")
+
+
+def __getattr__(name: str) -> Any:
+    # keep `config` importable without parsing mcpml.yaml at import time
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
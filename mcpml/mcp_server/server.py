@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import importlib
+import functools
 import inspect
 import logging
+import typing
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Literal, Optional, Type, Union
 
 from mcp import stdio_server
 from pydantic import BaseModel, Field
-import uvicorn
 
 from mcpml.config.mcpml import ToolDefinition, ToolParameter, MCPMLConfig
 from mcpml.mcp_server.tools import execute_tool
@@ -21,6 +23,37 @@ from mcp.types import (
     Tool,
 )
 
+# JSON schema for each supported parameter annotation
+_ANNOTATION_TO_SCHEMA = {
+    inspect.Parameter.empty: {"type": "string"},
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _sig_properties(implementation_path: str) -> Dict[str, Any]:
+    """Build the MCP input properties for a function implementation, once per path."""
+    module_name, function_name = implementation_path.rsplit(".", 1)
+    module = importlib.import_module(module_name)
+    implementation = getattr(module, function_name)
+    # get_type_hints resolves string annotations (e.g. from `from __future__ import annotations`);
+    # the signature still lists unannotated parameters, which default to strings
+    try:
+        hints = typing.get_type_hints(implementation)
+    except TypeError:
+        # e.g. functools.partial objects and callable instances, which only the signature handles
+        hints = {}
+    properties = {}
+    for name, param in inspect.signature(implementation).parameters.items():
+        annotation = hints.get(name, param.annotation)
+        schema = _ANNOTATION_TO_SCHEMA.get(annotation)
+        # copy the shared schema so a consumer mutating one tool's schema can't affect others
+        properties[name] = dict(schema) if schema else {"type": getattr(annotation, "__name__", "string")}
+    return properties
+
 class MCPMLServer:
     """
     Model Context Protocol Server implementation
@@ -30,33 +63,50 @@ class MCPMLServer:
     def __init__(self, config: MCPMLConfig):
         self._mcp_server = MCPServer(name=config.name)
         self.config = config
+        self._warm_tool_imports()
+        # The config is static while the server runs, so build the tool list once
+        self._tool_list = [
+            Tool(
+                name=tool.name,
+                description=tool.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": self.convert_to_mcp_schema(tool)
+                }
+            )
+            for tool in config.tools
+        ]
         self._setup_handlers()
+        # Capabilities depend on the registered handlers, so compute these after setup
+        self._init_opts = self._mcp_server.create_initialization_options()
+    def _warm_tool_imports(self) -> None:
+        """Build the function tool schemas concurrently so their module imports overlap."""
+        implementation_paths = {
+            tool.implementation
+            for tool in self.config.tools
+            if tool.type == "function" and tool.implementation
+        }
+        if len(implementation_paths) < 2:
+            return
+
+        def warm(implementation_path: str) -> None:
+            try:
+                _sig_properties(implementation_path)
+            except Exception:
+                # Best effort: some imports only fail off the main thread (e.g. signal.signal,
+                # import deadlocks); failures aren't cached, so the serial tool list build retries
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(8, len(implementation_paths))) as executor:
+            list(executor.map(warm, implementation_paths))
+
     def convert_to_mcp_schema(self, tool: ToolDefinition) -> Dict[str, Any]:
         """Convert a ToolDefinition to an MCP schema."""
         # if the tool is a function, load the implementation and get the parameters.
         # if the tool is an agent, the parameters are input:str
         if tool.type == "function":
-            # load the implementation and get the parameters
-            
-            module_name, function_name = tool.implementation.rsplit(".", 1)
-            module = importlib.import_module(module_name)
-            implementation = getattr(module, function_name)
-            # get the parameters from the implementation
-            parameters = inspect.signature(implementation).parameters
-            # convert the parameters to an MCP schema (depending on the type)
-            schema = {}
-            for name, param in parameters.items():
-                if param.annotation == inspect.Parameter.empty:
-                    schema[name] = {"type": "string"}
-                elif param.annotation == str:
-                    schema[name] = {"type": "string"}
-                elif param.annotation == int:
-                    schema[name] = {"type": "integer"}
-                elif param.annotation == float:
-                    schema[name] = {"type": "number"}
-                else:
-                    schema[name] = {"type": param.annotation.__name__}
-            return schema
+            # load the implementation and convert its parameters to an MCP schema
+            return _sig_properties(tool.implementation)
 
         else:
             return {"input": {"type": "string"}}
@@ -71,18 +121,7 @@ class MCPMLServer:
         @app.list_tools()
         async def list_tools() -> list[Tool]:
             """List all available tools."""
-            tools = self.config.tools
-            return [
-                Tool(
-                    name=tool.name,
-                    description=tool.description,
-                    inputSchema={
-                        "type": "object",
-                        "properties": self.convert_to_mcp_schema(tool)
-                    }
-                )
-                for tool in tools
-            ]
+            return self._tool_list
         
         @app.call_tool()
         async def call_tool(tool_name: str, parameters: Dict[str, Any]) -> Any:
@@ -102,17 +141,24 @@ class MCPMLServer:
         if transport == "stdio":
             asyncio.run(self.run_stdio_async())
         else:  # transport == "sse"
-            asyncio.run(self.run_sse_async())
+            # Prefer the libuv-based event loop for SSE when it is installed
+            try:
+                import uvloop
+            except ImportError:
+                asyncio.run(self.run_sse_async())
+            else:
+                uvloop.run(self.run_sse_async())
     async def run_stdio_async(self) -> None:
         """Run the server using stdio transport."""
         async with stdio_server() as (read_stream, write_stream):
             await self._mcp_server.run(
                 read_stream,
                 write_stream,
-                self._mcp_server.create_initialization_options(),
+                self._init_opts,
             )
     async def run_sse_async(self) -> None:
         """Run the server using SSE transport."""
+        import uvicorn
         from starlette.applications import Starlette
         from starlette.routing import Route, Mount
 
@@ -125,7 +171,7 @@ class MCPMLServer:
                 await self._mcp_server.run(
                     streams[0],
                     streams[1],
-                    self._mcp_server.create_initialization_options(),
+                    self._init_opts,
                 )
 
         starlette_app = Starlette(
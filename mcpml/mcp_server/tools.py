@@ -2,17 +2,17 @@
 MCP Tools implementation with dynamic loading support.
 """
 
+import functools
 import importlib
 import json
 import logging
-import os
-import sys
 import asyncio
 import inspect
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
-from mcpml.config import config
+from mcpml.config import get_config
+from mcpml.utils import ensure_cwd_on_path
 
 # Configure logging
 logging.basicConfig(
@@ -21,9 +21,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mcp-tools")
 
+@functools.lru_cache(maxsize=None)
 def _import_module_from_string(module_path: str) -> Any:
     """
     Import a module from a string path, checking both local and installed modules.
+    Successful imports are cached per module path.
     
     Args:
         module_path: Path to the module (e.g., "tools.hello")
@@ -41,9 +43,7 @@ def _import_module_from_string(module_path: str) -> Any:
         logger.debug(f"Could not import {module_path} directly, trying local import")
     
     # Try importing from current directory
-    current_dir = os.getcwd()
-    if current_dir not in sys.path:
-        sys.path.insert(0, current_dir)
+    ensure_cwd_on_path()
     
     try:
         return importlib.import_module(module_path)
@@ -52,6 +52,47 @@ def _import_module_from_string(module_path: str) -> Any:
         raise ImportError(f"Could not import {module_path}")
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve(path: str) -> Any:
+    """
+    Resolve a dotted attribute path (e.g. "tools.hello.say_hello") once per process.
+    
+    Args:
+        path: Module path followed by the attribute name
+        
+    Returns:
+        The resolved attribute
+    """
+    module_path, attribute_name = path.rsplit('.', 1)
+    return getattr(_import_module_from_string(module_path), attribute_name)
+
+
+def _is_msgspec_struct(schema_class: Any) -> bool:
+    """Check whether an output schema is a msgspec Struct (msgspec is optional)."""
+    try:
+        import msgspec
+    except ImportError:
+        return False
+    return isinstance(schema_class, type) and issubclass(schema_class, msgspec.Struct)
+
+
+def _decode_msgspec(result: Any, schema_class: Type) -> Any:
+    """
+    Decode and validate a tool result into a msgspec Struct in a single pass.
+    
+    Args:
+        result: Raw JSON (str/bytes) or already-decoded builtin data
+        schema_class: The msgspec Struct type to decode into
+        
+    Returns:
+        An instance of schema_class
+    """
+    import msgspec
+
+    if isinstance(result, (str, bytes)):
+        return msgspec.json.decode(result, type=schema_class)
+    return msgspec.convert(result, type=schema_class)
+
 
 def execute_tool(tool_name: str, **kwargs) -> Any:
     """
@@ -65,22 +106,16 @@ def execute_tool(tool_name: str, **kwargs) -> Any:
     Returns:
         The result of the tool execution
     """
-    tools =  config.tools    
-    print("execute_tool", tool_name, kwargs)
-    tool = next((t for t in tools if t.name == tool_name), None)
+    config = get_config()
+    logger.debug("execute_tool %s %s", tool_name, kwargs)
+    tool = config.tools_by_name.get(tool_name)
     if not tool:
         raise ValueError(f"Tool not found: {tool_name}")
 
     # Load implementation
     if tool.type == "function":
-        # Parse implementation path
-        module_path, function_name = tool.implementation.rsplit('.', 1)
-        
-        # Import module
-        module = _import_module_from_string(module_path)
-        
-        # Get function
-        func = getattr(module, function_name)
+        # Get function (cached per implementation path)
+        func = _resolve(tool.implementation)
         
         # Execute function
         if inspect.iscoroutinefunction(func):
@@ -93,10 +128,11 @@ def execute_tool(tool_name: str, **kwargs) -> Any:
         # Handle output schema if specified
         if tool.output_schema:
             try:
-                schema_module_path, schema_class_name = tool.output_schema.rsplit('.', 1)
-                schema_module = _import_module_from_string(schema_module_path)
-                schema_class = getattr(schema_module, schema_class_name)
-                result = schema_class.model_validate(result)
+                schema_class = _resolve(tool.output_schema)
+                if _is_msgspec_struct(schema_class):
+                    result = _decode_msgspec(result, schema_class)
+                else:
+                    result = schema_class.model_validate(result)
             except (ImportError, AttributeError) as e:
                 logger.warning(f"Could not apply output schema: {e}")
         
@@ -120,9 +156,8 @@ def execute_tool(tool_name: str, **kwargs) -> Any:
             # filter self
             tools = [t.name for t in tools if t.name != tool.name]
         elif len(tool.tools) > 0:
-            tools = config.tools
             # filter the tools to only include the ones in the tool
-            tools = [t.name for t in tools if t.name in tool.tools]
+            tools = [name for name in tool.tools if name in config.tools_by_name]
         else:
             tools = []
         if tool.max_turns is not None:
@@ -0,0 +1,21 @@
+"""
+Process-level helpers shared by the CLI and the MCP server
+"""
+
+import os
+import sys
+
+# Whether the current working directory has been put on sys.path
+_cwd_on_path = False
+
+
+def ensure_cwd_on_path() -> None:
+    """Make modules in the current working directory (tool implementations) importable, once per process"""
+    global _cwd_on_path
+    if _cwd_on_path:
+        return
+    cwd = os.getcwd()
+    # appended so working-directory modules never shadow installed packages
+    if cwd not in sys.path:
+        sys.path.append(cwd)
+    _cwd_on_path = True
@@ -18,6 +18,10 @@ requires = [
     "pip>=23.0.0",
 ]
 
+sse_requires = [
+    "uvloop>=0.18.0; sys_platform != 'win32'",
+]
+
 dev_requires = [
     "pytest>=7.0.0",
     "black>=23.0.0",
@@ -43,6 +47,7 @@ setup(
     python_requires=">=3.8",
     install_requires=requires,
     extras_require={
+        "sse": sse_requires,
         "dev": dev_requires,
     },
     entry_points={